@@ -1,54 +1,404 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
+import numpy as np
 import tkinter.font as tkFont
 import random
 import os
+import sys
+import queue
+import threading
+import warnings
+
+try:
+    import pyarrow  # noqa: F401  (enables the Feather cache)
+    HAS_FEATHER = True
+except ImportError:
+    HAS_FEATHER = False
 
 # ===== Global variables =====
 CSV_FILE_PATH = None
 df = None
 all_categories = []
+cat_to_indices = {}
+status_to_indices = {}
+nonmastered_idx = np.array([], dtype=np.int64)
+_dirty = False
+_csv_stale = False
+_journal = None
+_save_after_id = None
+SAVE_DELAY_MS = 2000
+SHOWS_PER_SAVE = 20
+_shows_since_save = 0
+POLL_INTERVAL_MS = 50
+_save_lock = threading.Lock()
+_ui_queue = queue.Queue()
+STATUS_VALUES = ["normal", "review", "mastered"]
+# Category is left to inference so numeric categories sort as numbers
+# when load_file converts it to a categorical
+CSV_DTYPES = {
+    "Deutsch": str,
+    "English": str,
+    "Status": "category",
+    "TimesShown": "int64",
+}
+# Only one sampling worker runs at a time, so sharing the generator is safe
+rng = np.random.default_rng()
+
+
+def _cache_path(csv_path):
+    """Path of the Feather cache kept next to a CSV file"""
+    return os.path.splitext(csv_path)[0] + ".feather"
+
+
+def _is_newer(path, *sources):
+    """True if path exists and is at least as new as every existing source"""
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    return all(mtime >= os.path.getmtime(src) for src in sources if os.path.exists(src))
+
+
+def _write_cache(data, csv_path):
+    """Write the Feather cache; returns False if it could not be written"""
+    if not HAS_FEATHER:
+        return False
+    cache = _cache_path(csv_path)
+    tmp = cache + ".tmp"
+    try:
+        # Write aside and swap in, so a crash never leaves a truncated cache
+        data.reset_index(drop=True).to_feather(tmp, compression="uncompressed")
+        os.replace(tmp, cache)
+        return True
+    except Exception:
+        # e.g. mixed-type columns Arrow can't represent; CSV still works
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+def _read_cache(csv_path, *sources):
+    """Read the Feather cache if it is newer than all sources, else None"""
+    cache = _cache_path(csv_path)
+    if not HAS_FEATHER or not _is_newer(cache, *sources):
+        return None
+    try:
+        return pd.read_feather(cache)
+    except Exception:
+        # A damaged cache is just rebuilt from the CSV
+        return None
+
+
+def _journal_path(csv_path):
+    """Path of the status journal kept next to a CSV file"""
+    return os.path.splitext(csv_path)[0] + ".journal"
+
+
+def _replay_journal(data, csv_path):
+    """Apply status changes logged since the CSV was last written to data
+
+    Returns True if any change was applied.
+    """
+    path = _journal_path(csv_path)
+    if not os.path.exists(path):
+        return False
+    replayed = False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            idx, _, status = line.strip().partition(",")
+            try:
+                idx = int(idx)
+            except ValueError:
+                continue
+            if idx in data.index and status in STATUS_VALUES:
+                data.at[idx, "Status"] = status
+                replayed = True
+    return replayed
+
+
+def _open_journal(csv_path):
+    """Close the previous file's journal and start appending to this one"""
+    global _journal
+
+    if _journal is not None:
+        _journal.close()
+    try:
+        _journal = open(_journal_path(csv_path), "a", encoding="utf-8", buffering=1)
+    except OSError:
+        # e.g. read-only folder; status changes fall back to regular saves
+        _journal = None
+
+
+def _log_status(idx, new_status):
+    """Record a status change in the journal instead of rewriting the file"""
+    global _dirty
+
+    if _journal is None:
+        _mark_dirty()
+        return
+    _journal.write(f"{idx},{new_status}\n")
+    # Written out with the next save; the journal covers it until then
+    _dirty = True
+
+
+def _truncate_journal():
+    """Empty the journal once the CSV holds every logged change"""
+    if _journal is not None:
+        with _save_lock:
+            _journal.seek(0)
+            _journal.truncate()
+
+
+def _read_csv(filepath):
+    """Read a CSV, telling the parser the dtypes of the known columns
+
+    Falls back to plain type inference if the hints don't fit the file
+    (e.g. blank TimesShown cells).
+    """
+    try:
+        with warnings.catch_warnings():
+            # e.g. NaN cast to int64 warns instead of raising on some pandas
+            warnings.simplefilter("error", RuntimeWarning)
+            return pd.read_csv(filepath, dtype=CSV_DTYPES, engine="c")
+    except (ValueError, TypeError, RuntimeWarning):
+        return pd.read_csv(filepath)
+
+
+def _dedupe_header(names):
+    """Rename repeated column names the way pandas does ("Notes", "Notes.1")"""
+    seen = {}
+    header = []
+    for name in names:
+        new_name = name
+        while new_name in seen:
+            seen[name] += 1
+            new_name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        seen[new_name] = 0
+        header.append(new_name)
+    return header
+
+
+def _read_excel(filepath):
+    """Read the first sheet of a workbook, without blank rows"""
+    data = _read_excel_frame(filepath)
+    # Same rows and labels whichever reader ran, matching a later re-read
+    # of the converted CSV
+    return data.dropna(how="all").reset_index(drop=True)
+
+
+def _read_excel_frame(filepath):
+    """Read the first sheet of a workbook with the fastest reader available
+
+    Prefers the Rust-backed calamine engine, then a streaming openpyxl read
+    that never builds the full workbook in memory.
+    """
+    try:
+        return pd.read_excel(filepath, engine="calamine")
+    except (ImportError, ValueError):
+        # python-calamine missing, or pandas too old to know the engine
+        pass
+
+    if filepath.endswith('.xls'):
+        # openpyxl only reads .xlsx
+        return pd.read_excel(filepath)
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = _dedupe_header([
+            name if name is not None else f"Unnamed: {i}"
+            for i, name in enumerate(next(rows, ()))
+        ])
+        width = len(header)
+        cols = [[] for _ in header]
+        for row in rows:
+            # read-only rows may be shorter than the header
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            for col, value in zip(cols, row):
+                col.append(value)
+    finally:
+        wb.close()
+
+    return pd.DataFrame(dict(zip(header, cols)))
+
+
+def _sidecar_path(workbook_path):
+    """CSV that stores a workbook's progress, named apart from the user's own CSVs"""
+    return os.path.splitext(workbook_path)[0] + ".progress.csv"
+
+
+def _is_own_sidecar(path):
+    """True if path has every column this app writes, i.e. looks like our sidecar"""
+    try:
+        cols = set(pd.read_csv(path, nrows=0).columns)
+    except Exception:
+        return False
+    return {"Deutsch", "English", "Category", "TimesShown", "Status"}.issubset(cols)
+
+
+def _carry_over_progress(new, sidecar):
+    """Copy TimesShown and Status from an earlier conversion onto new
+
+    Rows are matched on Deutsch/English, so progress follows the words even
+    if the workbook was reordered or edited since the last conversion.
+    """
+    old = _read_cache(sidecar, sidecar)
+    if old is None:
+        old = _read_csv(sidecar)
+    if "Status" in old.columns:
+        # The old journal refers to the old rows, so apply it here
+        old["Status"] = old["Status"].astype(object)
+        _replay_journal(old, sidecar)
+
+    keys = ["Deutsch", "English"]
+    cols = [c for c in ("TimesShown", "Status") if c in old.columns]
+    if not cols or not set(keys).issubset(old.columns) or not set(keys).issubset(new.columns):
+        return new
+
+    progress = old[keys + cols].drop_duplicates(keys).astype({c: object for c in cols})
+    matched = new[keys].merge(progress, on=keys, how="left")
+    for col in cols:
+        values = matched[col].to_numpy()
+        if col in new.columns:
+            new[col] = np.where(pd.isna(values), new[col].to_numpy(dtype=object), values)
+        else:
+            new[col] = values
+    return new
 
 
 def load_file(filepath):
-    """Load and validate a CSV or Excel file"""
-    global df, all_categories, CSV_FILE_PATH
+    """Load and validate a CSV or Excel file
+
+    Excel files are converted once to a CSV next to the original, and all
+    further saves go to that CSV. When pyarrow is installed, a Feather
+    cache is read instead of the CSV whenever it is up to date.
+    """
+    global df, all_categories, CSV_FILE_PATH, _dirty, _csv_stale, _shows_since_save
 
     try:
+        sidecar = None
+        converted = False
+        carried_over = False
+        from_cache = False
+
         # Determine file type and load accordingly
         if filepath.endswith('.csv'):
-            df = pd.read_csv(filepath)
+            cached = _read_cache(filepath, filepath)
+            if cached is not None:
+                data = cached
+                from_cache = True
+            else:
+                data = _read_csv(filepath)
         elif filepath.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(filepath)
+            sidecar = _sidecar_path(filepath)
+            own_sidecar = os.path.exists(sidecar) and _is_own_sidecar(sidecar)
+            if os.path.exists(sidecar) and not own_sidecar:
+                # Never reuse or silently replace a CSV we didn't write
+                if not messagebox.askyesno(
+                    "Overwrite file?",
+                    f"{os.path.basename(sidecar)} already exists and was not created by this app.\n\n"
+                    "Overwrite it with the converted workbook?"
+                ):
+                    return False
+
+            cached = _read_cache(sidecar, filepath, sidecar) if own_sidecar else None
+            if cached is not None:
+                data = cached
+                from_cache = True
+            # Reuse an earlier conversion so saved progress isn't overwritten
+            elif own_sidecar and _is_newer(sidecar, filepath):
+                data = _read_csv(sidecar)
+            else:
+                data = _read_excel(filepath)
+                converted = True
+                # The workbook changed after an earlier conversion; keep
+                # the progress saved for it instead of overwriting it
+                if own_sidecar:
+                    data = _carry_over_progress(data, sidecar)
+                    carried_over = True
         else:
             messagebox.showerror("Error", "Please select a CSV or Excel file (.csv, .xlsx, .xls)")
             return False
 
-        CSV_FILE_PATH = filepath
+        csv_path = sidecar or filepath
 
         # Validate required columns
         required_cols = {"Deutsch", "English", "Category"}
-        if not required_cols.issubset(df.columns):
+        if not required_cols.issubset(data.columns):
             messagebox.showerror(
                 "Error",
-                f"File must have columns: 'Deutsch', 'English', 'Category'\n\nFound columns: {', '.join(df.columns)}"
+                f"File must have columns: 'Deutsch', 'English', 'Category'\n\nFound columns: {', '.join(data.columns)}"
             )
             return False
 
         # Add optional columns if missing
-        if "TimesShown" not in df.columns:
-            df["TimesShown"] = 0
-        if "Status" not in df.columns:
-            df["Status"] = "normal"
+        added_columns = False
+        if "TimesShown" not in data.columns:
+            data["TimesShown"] = 0
+            added_columns = True
+        if "Status" not in data.columns:
+            data["Status"] = "normal"
+            added_columns = True
+
+        # Keep TimesShown integer so increments stay vectorized
+        data["TimesShown"] = pd.to_numeric(data["TimesShown"], errors="coerce").fillna(0).astype("int64")
+
+        # Categorical columns make filtering a cheap integer-code compare
+        data["Category"] = data["Category"].astype("category")
+        # Tidy up case/whitespace; custom statuses are kept as extra categories
+        status = data["Status"].astype(object).where(data["Status"].notna(), "normal")
+        status = status.astype(str).str.strip().str.lower().replace("", "normal")
+        extra = sorted(set(status.unique()) - set(STATUS_VALUES))
+        data["Status"] = pd.Categorical(status, categories=STATUS_VALUES + extra)
+
+        # Re-apply status changes that never made it into the CSV
+        # (a re-converted workbook already had it applied to its old rows)
+        replayed = not converted and _replay_journal(data, csv_path)
+
+        # Persist Excel workbooks as CSV from now on
+        if converted:
+            data.to_csv(sidecar, index=False)
+            messagebox.showinfo(
+                "Converted",
+                f"Progress for this workbook will be saved to:\n{os.path.basename(sidecar)}"
+                + ("\n\nProgress from the earlier conversion was kept for matching words."
+                   if carried_over else "")
+            )
+
+        # Build the Feather cache so the next load skips parsing
+        if not from_cache:
+            _write_cache(data, csv_path)
 
         # Get categories
-        all_categories = sorted(df["Category"].dropna().unique().tolist())
+        # Category is categorical, so its categories are already unique and sorted
+        data["Category"] = data["Category"].cat.remove_unused_categories()
+        categories = data["Category"].cat.categories.tolist()
+
+        # Only replace the current file once the new one loaded cleanly
+        df = data
+        CSV_FILE_PATH = csv_path
+        all_categories = categories
+        build_index_maps()
+
+        # The previous file was flushed before this one was opened. A cache
+        # newer than the CSV (e.g. after a crash) still needs exporting.
+        _dirty = False
+        _csv_stale = from_cache and not _is_newer(csv_path, _cache_path(csv_path))
+        _shows_since_save = 0
+
+        _open_journal(csv_path)
+        if converted:
+            # Its entries point at the old rows and are now in the CSV
+            _truncate_journal()
 
         # Save with new columns if needed
-        save_df()
+        if added_columns or replayed:
+            _mark_dirty()
 
-        messagebox.showinfo("Success", f"Loaded {len(df)} entries from {len(all_categories)} categories!")
+        messagebox.showinfo("Success", f"Loaded {len(data)} entries from {len(all_categories)} categories!")
         return True
 
     except Exception as e:
@@ -56,18 +406,125 @@ def load_file(filepath):
         return False
 
 
-def save_df():
-    """Save dataframe to file"""
+def build_index_maps():
+    """Precompute the df index labels belonging to each category and status"""
+    global cat_to_indices, status_to_indices, nonmastered_idx
+
+    cat_to_indices = {c: df.index[df["Category"] == c].to_numpy() for c in all_categories}
+    status_to_indices = {s: df.index[df["Status"] == s].to_numpy() for s in df["Status"].cat.categories}
+    # Custom statuses are sampled like "normal", as everything but mastered is
+    nonmastered_idx = df.index[df["Status"] != "mastered"].to_numpy()
+
+
+def set_status(idx, new_status):
+    """Change the status of one entry, keeping the index arrays in sync"""
+    global nonmastered_idx
+
+    old_status = df.at[idx, "Status"]
+    if old_status == new_status:
+        return
+    df.at[idx, "Status"] = new_status
+    old_arr = status_to_indices[old_status]
+    status_to_indices[old_status] = old_arr[old_arr != idx]
+    status_to_indices[new_status] = np.append(status_to_indices[new_status], idx)
+    if new_status == "mastered":
+        nonmastered_idx = np.setdiff1d(nonmastered_idx, [idx], assume_unique=True)
+    elif old_status == "mastered":
+        nonmastered_idx = np.union1d(nonmastered_idx, [idx])
+
+
+def _write_files(data, csv_path, export_csv):
+    """Write data to disk; the lock keeps overlapping saves in order
+
+    Only clears _csv_stale; save_df sets it on the Tk thread beforehand.
+    """
+    global _csv_stale
+
+    with _save_lock:
+        # Export the CSV before the cache so the cache stays the newer file
+        # and is the one read on the next load
+        if export_csv:
+            data.to_csv(csv_path, index=False)
+            _csv_stale = False
+        if not _write_cache(data, csv_path) and not export_csv:
+            data.to_csv(csv_path, index=False)
+            _csv_stale = False
+
+
+def _save_in_background(data, csv_path, export_csv):
+    """Thread target for save_df; errors are reported back on the Tk thread"""
+    try:
+        _write_files(data, csv_path, export_csv)
+    except Exception as e:
+        _ui_queue.put(("error", f"Failed to save file:\n{str(e)}"))
+
+
+def save_df(export_csv=True, background=False):
+    """Save dataframe to the Feather cache and, if requested, the CSV file
+
+    The CSV is always written if the cache can't be (e.g. no pyarrow).
+    Background saves write a snapshot so the UI can keep editing df.
+    """
+    global _csv_stale
+
     if CSV_FILE_PATH and df is not None:
+        # Set before any write starts so save_now can't miss a pending
+        # export, even while a background save hasn't taken the lock yet
+        _csv_stale = True
+        if background:
+            threading.Thread(
+                target=_save_in_background,
+                args=(df.copy(), CSV_FILE_PATH, export_csv),
+                daemon=True,
+            ).start()
+            return
         try:
-            if CSV_FILE_PATH.endswith('.csv'):
-                df.to_csv(CSV_FILE_PATH, index=False)
-            elif CSV_FILE_PATH.endswith(('.xlsx', '.xls')):
-                df.to_excel(CSV_FILE_PATH, index=False)
+            _write_files(df, CSV_FILE_PATH, export_csv)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
 
 
+def _mark_dirty():
+    """Flag unsaved changes and schedule a debounced save"""
+    global _dirty, _save_after_id
+
+    _dirty = True
+    if _save_after_id is not None:
+        root.after_cancel(_save_after_id)
+    _save_after_id = root.after(SAVE_DELAY_MS, lambda: _flush_if_dirty(background=True))
+
+
+def _flush_if_dirty(export_csv=False, background=False):
+    """Write pending changes to disk, if any
+
+    Debounced saves only update the Feather cache; pass export_csv to also
+    bring the CSV file up to date.
+    """
+    global _dirty, _save_after_id
+
+    if _save_after_id is not None:
+        root.after_cancel(_save_after_id)
+        _save_after_id = None
+    if _dirty or (export_csv and _csv_stale):
+        save_df(export_csv, background)
+        _dirty = False
+
+
+def save_now():
+    """Write all pending changes, including the CSV file"""
+    _flush_if_dirty(export_csv=True)
+    if not _csv_stale:
+        _truncate_journal()
+
+
+def on_close():
+    """Flush pending changes before closing the window"""
+    save_now()
+    if _journal is not None:
+        _journal.close()
+    root.destroy()
+
+
 def open_file():
     """Open file dialog to select data file"""
     filepath = filedialog.askopenfilename(
@@ -80,133 +537,168 @@ def open_file():
     )
 
     if filepath:
+        # Don't lose unsaved changes to the previously loaded file
+        save_now()
         if load_file(filepath):
             # Update UI with new categories
             setup_category_inputs()
-            file_label.config(text=f"File: {os.path.basename(filepath)}")
+            file_label.config(text=f"File: {os.path.basename(CSV_FILE_PATH)}")
 
 
 def setup_category_inputs():
-    """Dynamically create category input fields"""
-    global category_vars
+    """Create the category count variables and show the visible rows
 
-    # Clear existing category widgets
-    for widget in category_frame.winfo_children():
-        widget.destroy()
+    Only the rows in view get widgets; they are recycled while scrolling,
+    so files with hundreds of categories don't create thousands of widgets.
+    """
+    global category_vars, category_int_counts, _category_header_height, _category_row_height
 
     category_vars = {}
+    category_int_counts = {}
+    for cat in all_categories:
+        sv = tk.StringVar(value="1")
+        sv.trace_add("write", lambda *_, c=cat, s=sv: _on_cat_change(c, s))
+        category_vars[cat] = sv
+        category_int_counts[cat] = 1
 
-    if not all_categories:
-        ttk.Label(category_frame, text="No categories loaded").pack()
-        return
+    if all_categories:
+        category_header.config(text="Category counts (default 1):",
+                               font=('TkDefaultFont', 10, 'bold'))
+    else:
+        category_header.config(text="No categories loaded", font='TkDefaultFont')
 
-    ttk.Label(category_frame, text="Category counts (default 1):",
-              font=('TkDefaultFont', 10, 'bold')).pack(anchor='w', pady=(5, 5))
+    # Measure the header and one row once; every row has the same height
+    if not _category_rows:
+        _category_rows.append(_make_category_row())
+    category_canvas.update_idletasks()
+    _category_header_height = category_header.winfo_reqheight() + 10
+    _category_row_height = _category_rows[0][1].winfo_reqheight() + 4
+
+    total_height = _category_header_height + len(all_categories) * _category_row_height
+    category_canvas.configure(scrollregion=(0, 0, category_canvas.winfo_reqwidth(), total_height))
+    category_canvas.yview_moveto(0)
+    render_category_rows()
+
+
+def _on_cat_change(cat, sv):
+    """Mirror an edited category count as an int for show_entries"""
+    try:
+        category_int_counts[cat] = int(sv.get())
+    except ValueError:
+        category_int_counts[cat] = 0
 
-    for i, cat in enumerate(all_categories):
-        sv = tk.StringVar(value="1")
-        category_vars[cat] = sv
 
-        row_frame = ttk.Frame(category_frame)
-        row_frame.pack(fill='x', pady=2)
+def _make_category_row():
+    """Create one reusable category row, initially hidden"""
+    row_frame = ttk.Frame(category_canvas)
+    label = ttk.Label(row_frame, width=20)
+    label.pack(side='left')
+    entry = ttk.Entry(row_frame, width=5)
+    entry.pack(side='left', padx=5)
+    item = category_canvas.create_window((0, 0), window=row_frame, anchor="nw", state="hidden")
+    return item, row_frame, label, entry
 
-        ttk.Label(row_frame, text=cat, width=20).pack(side='left')
-        ttk.Entry(row_frame, textvariable=sv, width=5).pack(side='left', padx=5)
+
+def render_category_rows(*_):
+    """Bind the pooled row widgets to the categories currently in view"""
+    if not _category_row_height:
+        return
+
+    top = category_canvas.canvasy(0)
+    bottom = category_canvas.canvasy(category_canvas.winfo_height())
+    first = max(0, int((top - _category_header_height) // _category_row_height))
+    last = min(len(all_categories), int((bottom - _category_header_height) // _category_row_height) + 1)
+
+    while len(_category_rows) < last - first:
+        _category_rows.append(_make_category_row())
+
+    for slot, (item, _, label, entry) in enumerate(_category_rows):
+        i = first + slot
+        if i < last:
+            cat = all_categories[i]
+            label.config(text=cat)
+            # The Entry writes straight into the category's StringVar
+            entry.config(textvariable=category_vars[cat])
+            category_canvas.coords(item, 0, _category_header_height + i * _category_row_height + 2)
+            category_canvas.itemconfigure(item, state="normal")
+        else:
+            category_canvas.itemconfigure(item, state="hidden")
+
+
+def _on_category_scroll(first, last):
+    """Keep the scrollbar in sync and re-render the rows now in view"""
+    category_scrollbar.set(first, last)
+    render_category_rows()
 
 
 # ===== sampling logic =====
-def sample_items(category_counts, review_count, display_mode):
-    """Sample items based on category counts and review items"""
-    if df is None or len(df) == 0:
-        messagebox.showerror("Error", "No data loaded. Please open a file first.")
-        return []
+def sample_items(category_counts, review_count, fallback_count):
+    """Sample df indices based on category counts and review items
 
+    Runs on a worker thread, so it must not touch any Tk widgets.
+    """
     selected = []
-    base_pool = df[df["Status"] != "mastered"].copy()
+    taken = set()
 
     # 1) Pick review items first
-    review_pool = base_pool[base_pool["Status"] == "review"]
-    if review_count > 0 and len(review_pool) > 0:
-        review_count = min(review_count, len(review_pool))
-        review_sample = review_pool.sample(review_count)
-
-        for idx, row in review_sample.iterrows():
-            text = format_display_text(row, display_mode)
-            selected.append((idx, text))
-
-        base_pool = base_pool.drop(index=review_sample.index)
+    review_pool = status_to_indices["review"]
+    if review_count > 0 and review_pool.size > 0:
+        review_count = min(review_count, review_pool.size)
+        review_idx = rng.choice(review_pool, size=review_count, replace=False)
+        taken.update(review_idx.tolist())
+        selected.extend(review_idx.tolist())
 
     # 2) Category-based sampling
     total_cat_requested = sum(category_counts.values())
 
     if total_cat_requested == 0 and review_count == 0:
-        try:
-            n = int(num_entries.get())
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid number.")
-            return []
+        n = min(fallback_count, nonmastered_idx.size)
+        return rng.choice(nonmastered_idx, size=n, replace=False).tolist()
 
-        n = min(n, len(base_pool))
-        sample_rows = base_pool.sample(n)
-
-        for idx, row in sample_rows.iterrows():
-            text = format_display_text(row, display_mode)
-            selected.append((idx, text))
-        return selected
-
-    # Sample from each category
+    # Sample from each category, skipping mastered and already picked rows
+    mastered = status_to_indices["mastered"]
     for cat, needed in category_counts.items():
-        if needed <= 0:
+        if needed <= 0 or cat not in cat_to_indices:
             continue
 
-        pool_cat = base_pool[base_pool["Category"] == cat]
-        if len(pool_cat) == 0:
+        pool_cat = cat_to_indices[cat]
+        pool_cat = pool_cat[~np.isin(pool_cat, mastered)]
+        if taken:
+            pool_cat = pool_cat[~np.isin(pool_cat, list(taken))]
+        if pool_cat.size == 0:
             continue
 
-        needed = min(needed, len(pool_cat))
-        sample_rows = pool_cat.sample(needed)
-
-        for idx, row in sample_rows.iterrows():
-            text = format_display_text(row, display_mode)
-            selected.append((idx, text))
-
-        base_pool = base_pool.drop(index=sample_rows.index)
+        needed = min(needed, pool_cat.size)
+        cat_idx = rng.choice(pool_cat, size=needed, replace=False)
+        taken.update(cat_idx.tolist())
+        selected.extend(cat_idx.tolist())
 
     return selected
 
 
-def format_display_text(row, mode):
-    """Format text based on display mode"""
-    if mode == "Deutsch":
-        return row["Deutsch"]
-    elif mode == "English":
-        return row["English"]
-    else:
-        return f"{row['Deutsch']}  —  {row['English']}"
+def format_display_column(subdf, mode):
+    """Format the display text of every row in subdf at once"""
+    if mode in ("Deutsch", "English"):
+        return subdf[mode].to_numpy(dtype=str)
+    return (subdf["Deutsch"].astype(str) + "  —  " + subdf["English"].astype(str)).to_numpy(dtype=str)
 
 
 # ===== UI callbacks =====
 current_selection_indices = []
+item_id_to_df_idx = {}
 
 
 def show_entries():
-    """Show sampled entries"""
-    global current_selection_indices
-
-    if df is None:
+    """Read the inputs and start sampling on a worker thread"""
+    if df is None or len(df) == 0:
         messagebox.showerror("Error", "Please load a file first!")
         return
 
     mode = display_mode.get()
 
-    # Collect category counts
-    cat_counts = {}
-    for cat, sv in category_vars.items():
-        try:
-            val = int(sv.get())
-        except ValueError:
-            val = 0
-        cat_counts[cat] = val
+    # Category counts are kept up to date by the StringVar traces;
+    # copy them since the worker thread reads them later
+    cat_counts = dict(category_int_counts)
 
     # Review count
     try:
@@ -214,33 +706,84 @@ def show_entries():
     except ValueError:
         review_n = 0
 
-    results = sample_items(cat_counts, review_n, mode)
-    if not results:
+    # Fallback count, only needed when nothing else was requested
+    fallback_n = 0
+    if sum(cat_counts.values()) == 0 and review_n == 0:
+        try:
+            fallback_n = int(num_entries.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid number.")
+            return
+
+    show_button.config(state="disabled")
+    threading.Thread(
+        target=_sample_worker,
+        args=(df, cat_counts, review_n, fallback_n, mode),
+        daemon=True,
+    ).start()
+
+
+def _sample_worker(source_df, cat_counts, review_n, fallback_n, mode):
+    """Thread target for show_entries; hands the results to the Tk thread"""
+    try:
+        results = sample_items(cat_counts, review_n, fallback_n)
+        _ui_queue.put(("show", (source_df, results, mode)))
+    except Exception as e:
+        _ui_queue.put(("show_error", f"Failed to sample entries:\n{str(e)}"))
+
+
+def _apply_show(source_df, idx_list, mode):
+    """Display sampled entries and count them as shown"""
+    global current_selection_indices
+
+    # Drop results sampled from a file that has since been replaced
+    if not idx_list or source_df is not df:
         return
 
     # Update TimesShown
-    for idx, _ in results:
-        df.at[idx, "TimesShown"] = int(df.at[idx, "TimesShown"]) + 1
-    save_df()
+    df.loc[idx_list, "TimesShown"] += 1
+    _count_show()
+
+    # Update UI from a single lookup of all selected rows
+    current_selection_indices = idx_list
+    view = df.loc[current_selection_indices, list(columns)]
 
-    # Update UI
     text_output.delete(1.0, tk.END)
-    for row in tree.get_children():
-        tree.delete(row)
+    text_output.insert(tk.END, "".join(text + "\n" for text in format_display_column(view, mode)))
+    refresh_tree_rows(view)
+
+
+def _count_show():
+    """Flag new TimesShown counts, but only schedule a save every few shows"""
+    global _dirty, _shows_since_save
 
-    current_selection_indices = []
-    for idx, text in results:
-        current_selection_indices.append(idx)
-        row = df.loc[idx]
+    _dirty = True
+    _shows_since_save += 1
+    if _shows_since_save >= SHOWS_PER_SAVE:
+        _shows_since_save = 0
+        _mark_dirty()
 
-        text_output.insert(tk.END, text + "\n")
-        tree.insert("", tk.END, values=(
-            row["Deutsch"],
-            row["English"],
-            row["Category"],
-            row["Status"],
-            row["TimesShown"],
-        ))
+
+def _poll_queue():
+    """Handle results posted by worker threads"""
+    try:
+        while True:
+            try:
+                kind, payload = _ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            # One failing message must not stop the queue from being drained
+            try:
+                if kind in ("show", "show_error"):
+                    show_button.config(state="normal")
+                if kind == "show":
+                    _apply_show(*payload)
+                else:
+                    messagebox.showerror("Error", payload)
+            except Exception:
+                root.report_callback_exception(*sys.exc_info())
+    finally:
+        root.after(POLL_INTERVAL_MS, _poll_queue)
 
 
 def get_selected_df_index_from_tree():
@@ -250,21 +793,15 @@ def get_selected_df_index_from_tree():
         messagebox.showwarning("No selection", "Please select a word in the table.")
         return None
 
-    item_id = selected[0]
-    all_items = tree.get_children()
-    pos = all_items.index(item_id)
-
-    if pos >= len(current_selection_indices):
-        return None
-    return current_selection_indices[pos]
+    return item_id_to_df_idx.get(selected[0])
 
 
 def mark_review():
     idx = get_selected_df_index_from_tree()
     if idx is None:
         return
-    df.at[idx, "Status"] = "review"
-    save_df()
+    set_status(idx, "review")
+    _log_status(idx, "review")
     refresh_tree_rows()
 
 
@@ -272,8 +809,8 @@ def mark_mastered():
     idx = get_selected_df_index_from_tree()
     if idx is None:
         return
-    df.at[idx, "Status"] = "mastered"
-    save_df()
+    set_status(idx, "mastered")
+    _log_status(idx, "mastered")
     refresh_tree_rows()
 
 
@@ -281,24 +818,27 @@ def clear_status():
     idx = get_selected_df_index_from_tree()
     if idx is None:
         return
-    df.at[idx, "Status"] = "normal"
-    save_df()
+    set_status(idx, "normal")
+    _log_status(idx, "normal")
     refresh_tree_rows()
 
 
-def refresh_tree_rows():
-    """Refresh tree display"""
-    for row in tree.get_children():
-        tree.delete(row)
-    for idx in current_selection_indices:
-        row = df.loc[idx]
-        tree.insert("", tk.END, values=(
-            row["Deutsch"],
-            row["English"],
-            row["Category"],
-            row["Status"],
-            row["TimesShown"],
-        ))
+def refresh_tree_rows(view=None):
+    """Refresh tree display
+
+    view may hold the already fetched rows of current_selection_indices.
+    """
+    if view is None:
+        view = df.loc[current_selection_indices, list(columns)]
+
+    # Hide the tree while repopulating so Tk lays it out only once
+    tree.grid_remove()
+    tree.delete(*tree.get_children())
+    item_id_to_df_idx.clear()
+    for idx, values in zip(current_selection_indices, view.itertuples(index=False, name=None)):
+        iid = tree.insert("", tk.END, values=values)
+        item_id_to_df_idx[iid] = idx
+    tree.grid()
 
 
 # ===== UI setup =====
@@ -317,6 +857,7 @@ file_frame = ttk.Frame(main_frame)
 file_frame.grid(row=0, column=0, columnspan=2, sticky="EW", pady=(0, 10))
 
 ttk.Button(file_frame, text="📁 Open Vocabulary File", command=open_file).pack(side='left', padx=5)
+ttk.Button(file_frame, text="💾 Save", command=save_now).pack(side='left', padx=5)
 file_label = ttk.Label(file_frame, text="No file loaded", foreground="gray")
 file_label.pack(side='left', padx=10)
 
@@ -327,20 +868,21 @@ controls.grid(row=1, column=0, sticky="N", padx=(0, 10))
 # Scrollable category frame
 category_canvas = tk.Canvas(controls, width=250, height=400)
 category_scrollbar = ttk.Scrollbar(controls, orient="vertical", command=category_canvas.yview)
-category_frame = ttk.Frame(category_canvas)
+category_header = ttk.Label(category_canvas, text="")
 
-category_canvas.create_window((0, 0), window=category_frame, anchor="nw")
-category_canvas.configure(yscrollcommand=category_scrollbar.set)
+category_canvas.create_window((0, 5), window=category_header, anchor="nw")
+category_canvas.configure(yscrollcommand=_on_category_scroll)
 
 category_canvas.pack(side="left", fill="both", expand=True)
 category_scrollbar.pack(side="right", fill="y")
 
-category_frame.bind(
-    "<Configure>",
-    lambda e: category_canvas.configure(scrollregion=category_canvas.bbox("all"))
-)
+category_canvas.bind("<Configure>", render_category_rows)
 
 category_vars = {}
+category_int_counts = {}
+_category_rows = []
+_category_header_height = 0
+_category_row_height = 0
 
 # Control panel below categories
 control_panel = ttk.Frame(main_frame)
@@ -360,7 +902,8 @@ ttk.Label(control_panel, text="Review items:").grid(row=3, column=0, sticky="W",
 review_entries = tk.StringVar(value="0")
 ttk.Entry(control_panel, textvariable=review_entries, width=6).grid(row=3, column=1, sticky="W", padx=5)
 
-ttk.Button(control_panel, text="Show", command=show_entries).grid(row=4, column=0, columnspan=3, pady=10)
+show_button = ttk.Button(control_panel, text="Show", command=show_entries)
+show_button.grid(row=4, column=0, columnspan=3, pady=10)
 
 # ===== Right: Output =====
 output_frame = ttk.Frame(main_frame)
@@ -390,4 +933,7 @@ ttk.Button(flag_frame, text="Clear status", command=clear_status).grid(row=0, co
 main_frame.rowconfigure(1, weight=1)
 main_frame.columnconfigure(1, weight=1)
 
+root.protocol("WM_DELETE_WINDOW", on_close)
+root.after(POLL_INTERVAL_MS, _poll_queue)
+
 root.mainloop()
\ No newline at end of file